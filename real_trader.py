@@ -5,7 +5,15 @@ import os
 import time
 import threading
 
+def _ccxt_id(name):
+    """Map a configured exchange name to its ccxt module id."""
+    ccxt_id = name.lower().replace('.', '').replace(' ', '')
+    if ccxt_id == 'gateio': ccxt_id = 'gate'
+    return ccxt_id
+
 class RealTrader:
+    _MARKETS_TTL = 3600  # seconds before a symbol index is rebuilt from fresh markets
+
     def __init__(self, config_file='exchange_config.json'):
         self.config_file = config_file
         self.exchanges = {}
@@ -42,44 +50,102 @@ class RealTrader:
             'options': {'defaultType': 'future'} # Default to futures for all
         }
         self.save_config()
-        self.init_exchanges() # Re-init to apply changes
+        # Rebuild only the exchange whose keys changed; the other
+        # connections keep their warm rate-limiter and markets state.
+        self._init_one(exchange_name.upper(), self.config['exchanges'][exchange_name.upper()])
         return True
 
     def update_settings(self, auto_enabled, risk_type, risk_value, filters):
+        risk_settings = {'type': risk_type, 'value': float(risk_value)}
+        if (auto_enabled == self.auto_trade_enabled
+                and risk_settings == self.risk_settings
+                and filters == self.trade_filter):
+            return  # nothing changed - skip the synchronous config rewrite
+
         self.auto_trade_enabled = auto_enabled
-        self.risk_settings = {'type': risk_type, 'value': float(risk_value)}
+        self.risk_settings = risk_settings
         self.trade_filter = filters
-        
+
         self.config['auto_trade_enabled'] = auto_enabled
         self.config['risk_settings'] = self.risk_settings
         self.config['trade_filter'] = filters
         self.save_config()
 
     def init_exchanges(self):
+        """Cold-start: build every configured exchange from scratch."""
         self.exchanges = {}
+        self._market_index = {}  # per-exchange symbol lookup, built on first trade
+        self._market_index_at = {}  # build time, for the hourly refresh
         if 'exchanges' not in self.config: return
 
         for name, conf in self.config['exchanges'].items():
+            self._init_one(name, conf)
+
+    def _init_one(self, name, conf):
+        """(Re)build a single exchange connection and drop its stale caches."""
+        self.exchanges.pop(name, None)
+        self._market_index.pop(name, None)
+        self._market_index_at.pop(name, None)
+        try:
+            ccxt_id = _ccxt_id(name)
+
+            if hasattr(ccxt, ccxt_id):
+                exchange_class = getattr(ccxt, ccxt_id)
+                exchange = exchange_class(conf)
+
+                # Verify Futures Support
+                if not exchange.has['createOrder']:
+                    print(f"❌ {name} does not support order creation via CCXT")
+                    return
+
+                self.exchanges[name] = exchange
+                print(f"✅ RealTrader: Connected to {name}")
+            else:
+                print(f"❌ RealTrader: Exchange {name} not found in CCXT")
+        except Exception as e:
+            print(f"❌ RealTrader: Failed to init {name}: {e}")
+
+    def _resolve_market_symbol(self, exchange_name, exchange, symbol):
+        """Look up the exchange's market symbol for a raw signal symbol.
+
+        The lookup table is built once per exchange from load_markets()
+        and keyed on both the slash-stripped symbol (BTC/USDT -> BTCUSDT)
+        and the exchange's raw market id, so each trade does one dict
+        lookup instead of scanning every market. Returns None if unknown.
+        """
+        index = self._market_index.get(exchange_name)
+        if index is None or time.time() - self._market_index_at.get(exchange_name, 0) > self._MARKETS_TTL:
+            # reload=True only on the hourly rebuild; the first build can
+            # use whatever CCXT already cached for this exchange
+            exchange.load_markets(index is not None)
+            index = self._market_index[exchange_name] = self._build_market_index(exchange)
+            self._market_index_at[exchange_name] = time.time()
+        return index.get(symbol)
+
+    @staticmethod
+    def _build_market_index(exchange):
+        index = {}
+        for m, info in exchange.markets.items():
+            index.setdefault(m.replace('/', ''), m)
+            index.setdefault(info['id'], m)
+        return index
+
+    def refresh_markets(self, exchange_name=None):
+        """Reload markets (one exchange or all) and rebuild the symbol indices.
+
+        Indices also refresh themselves once _MARKETS_TTL elapses; call
+        this when a new listing should become tradeable immediately.
+        """
+        names = [exchange_name.upper()] if exchange_name else list(self.exchanges)
+        for name in names:
+            exchange = self.exchanges.get(name)
+            if not exchange: continue
             try:
-                # Map common names to ccxt IDs
-                ccxt_id = name.lower().replace('.', '').replace(' ', '')
-                if ccxt_id == 'gateio': ccxt_id = 'gate'
-                
-                if hasattr(ccxt, ccxt_id):
-                    exchange_class = getattr(ccxt, ccxt_id)
-                    exchange = exchange_class(conf)
-                    
-                    # Verify Futures Support
-                    if not exchange.has['createOrder']:
-                        print(f"❌ {name} does not support order creation via CCXT")
-                        continue
-                        
-                    self.exchanges[name] = exchange
-                    print(f"✅ RealTrader: Connected to {name}")
-                else:
-                    print(f"❌ RealTrader: Exchange {name} not found in CCXT")
+                exchange.load_markets(reload=True)
+                self._market_index[name] = self._build_market_index(exchange)
+                self._market_index_at[name] = time.time()
             except Exception as e:
-                print(f"❌ RealTrader: Failed to init {name}: {e}")
+                print(f"Market refresh failed for {name}: {e}")
 
     def get_balance(self, exchange_name):
         exchange = self.exchanges.get(exchange_name.upper())
@@ -123,16 +189,10 @@ class RealTrader:
         # For now, we try standard CCXT discovery or common formats.
         market_symbol = symbol
         try:
-            exchange.load_markets()
-            # Try to find the market
-            found = False
-            for m in exchange.markets:
-                if m.replace('/', '') == symbol or exchange.markets[m]['id'] == symbol:
-                    market_symbol = m
-                    found = True
-                    break
-            
-            if not found:
+            resolved = self._resolve_market_symbol(exchange_name, exchange, symbol)
+            if resolved:
+                market_symbol = resolved
+            else:
                  # Fallback for common futures formats
                  if exchange_name == 'BINANCE': market_symbol = symbol # Binance supports BTCUSDT
                  elif exchange_name == 'BYBIT': market_symbol = symbol 
@@ -187,21 +247,28 @@ class RealTrader:
             params = {}
             if exchange_name == 'BINANCE':
                 params = {'positionSide': 'LONG' if side == 'buy' else 'SHORT'}
+            elif exchange_name in ('BYBIT', 'BITGET'):
+                # These accept the protective stop on the entry order
+                # itself (CCXT maps params['stopLoss']), so entry + SL
+                # is one round-trip and there is no window where the
+                # position sits unprotected waiting on a second call.
+                # The dict form is required: Bitget resolves only
+                # triggerPrice/stopPrice inside the stopLoss value,
+                # and Bybit accepts the same shape.
+                params = {'stopLoss': {'triggerPrice': stop_loss}}
 
-            # 1. Entry
+            # 1. Entry (carries the SL where the exchange supports it)
             order = exchange.create_market_order(market_symbol, side, position_size_in_assets, params=params)
-            
-            # 2. Stop Loss (Essential)
-            sl_side = 'sell' if side == 'buy' else 'buy'
-            sl_params = params.copy()
-            sl_params['stopPrice'] = stop_loss
-            
-            # Exchange specific SL params
+
+            # 2. Stop Loss (Binance futures wants a separate STOP_MARKET order)
             if exchange_name == 'BINANCE':
+                sl_side = 'sell' if side == 'buy' else 'buy'
+                sl_params = params.copy()
+                sl_params['stopPrice'] = stop_loss
                 sl_params['type'] = 'STOP_MARKET'
                 sl_params['workingType'] = 'MARK_PRICE'
                 exchange.create_order(market_symbol, 'STOP_MARKET', sl_side, position_size_in_assets, None, sl_params)
-            else:
+            elif exchange_name not in ('BYBIT', 'BITGET'):
                  # Generic OCO or separate stop trigger if supported
                  # For MVP, we log that SL needs to be handled if not Binance
                  pass
@@ -1119,19 +1119,20 @@ def market_monitor_loop():
         try:
             current_time = time.time()
             
-            # check volatility every 5 seconds
-            try:
-                news_manager.check_btc_volatility()
-            except:
-                pass  # Silently handle volatility check errors
-            
-            # fetch news every 5 seconds
+            # check volatility every cycle; when the news fetch is also
+            # due, refresh_all() runs both requests concurrently so the
+            # slow RSS round-trip doesn't delay the volatility poll
             if current_time - last_news_time >= 5:
                 try:
-                    news_manager.fetch_news()
+                    news_manager.refresh_all()
                     last_news_time = current_time
                 except:
-                    pass  # Silently handle news fetch errors
+                    pass  # Silently handle refresh errors
+            else:
+                try:
+                    news_manager.check_btc_volatility()
+                except:
+                    pass  # Silently handle volatility check errors
                 
             # Broadcast status to ALL clients
             try: